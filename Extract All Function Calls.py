@@ -1,29 +1,18 @@
-from pycparser import c_parser, c_ast, parse_file
+import sys
 
-class FunctionCallVisitor(c_ast.NodeVisitor):
-    def __init__(self):
-        self.calls = []
-    
-    def visit_FuncCall(self, node):
-        if hasattr(node.name, 'name'):
-            self.calls.append({
-                'function': node.name.name,
-                'line': node.coord.line if node.coord else None
-            })
-        self.generic_visit(node)
+from move_analyzer import analyze_file
 
-ast = parse_file('source_code/process_a.c', use_cpp=True)
-visitor = FunctionCallVisitor()
-visitor.visit(ast)
+analyzer = analyze_file('source_code/process_a.c')
+if analyzer is None:
+    sys.exit(1)
 
-for call in visitor.calls:
+# Repeated calls to the same function on the same line are listed once
+for call in analyzer.get_calls_with_lines():
     print(f"Call to {call['function']} at line {call['line']}")
-```
 
-**Output:**
-```
-Call to init_system at line 12
-Call to move_read at line 28
-Call to validate_input at line 30
-Call to move_write at line 45
-Call to log_error at line 50
+# Example output:
+#   Call to init_system at line 12
+#   Call to move_read at line 28
+#   Call to validate_input at line 30
+#   Call to move_write at line 45
+#   Call to log_error at line 50
@@ -0,0 +1,720 @@
+"""
+MOVE Middleware C Code Analyzer
+Extracts function calls, MOVE operations, and generates reports
+"""
+
+from pycparser import c_ast, c_lexer, c_parser
+import pycparser
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import hashlib
+import io
+import os
+import json
+import pickle
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# MOVE function classifications
+MOVE_READ_FUNCS = ['move_read', 'move_get', 'move_fetch', 'move_load']
+MOVE_WRITE_FUNCS = ['move_write', 'move_put', 'move_store', 'move_save']
+MOVE_CREATE_FUNCS = ['move_create', 'move_open']
+MOVE_DELETE_FUNCS = ['move_delete', 'move_remove', 'move_close']
+
+ALL_MOVE_FUNCS = MOVE_READ_FUNCS + MOVE_WRITE_FUNCS + MOVE_CREATE_FUNCS + MOVE_DELETE_FUNCS
+
+# Single lookup table: MOVE function name -> operation type
+FUNC_TO_OPTYPE = ({f: 'READ' for f in MOVE_READ_FUNCS}
+                  | {f: 'WRITE' for f in MOVE_WRITE_FUNCS}
+                  | {f: 'CREATE' for f in MOVE_CREATE_FUNCS}
+                  | {f: 'DELETE' for f in MOVE_DELETE_FUNCS})
+
+
+def _child_fields(cls):
+    """Return (field, is_list) pairs in the order cls.children() yields them"""
+    probe = cls.__new__(cls)
+    for slot in cls.__slots__:
+        if slot != '__weakref__':
+            setattr(probe, slot, [None])
+    return tuple((name.split('[')[0], name.endswith(']'))
+                 for name, _ in probe.children())
+
+
+# Child-bearing fields per AST node class, computed once at import so
+# generic_visit can skip building children() tuples for every node
+_CHILD_FIELDS = {cls: _child_fields(cls) for cls in vars(c_ast).values()
+                 if isinstance(cls, type) and issubclass(cls, c_ast.Node)
+                 and cls is not c_ast.Node}
+
+CPP_ARGS = ['-E', '-I/usr/include', '-I./include']
+
+# Resolved once; a full path lets subprocess use posix_spawn (see preprocess_cached)
+CPP_PATH = shutil.which('cpp') or 'cpp'
+
+CACHE_DIRNAME = '.move_analyzer_cache'
+
+# Part of every parse-cache key: bump when extraction logic or the cached layout changes
+CACHE_VERSION = 1
+
+# Cache entries (.i and .pkl files) unused for this long (seconds) are pruned
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+# cpp linemarkers name every file that went into a translation unit
+_LINEMARKER = re.compile(r'^# \d+ "([^"]*)"', re.M)
+
+_pruned_cache_dirs = set()
+
+
+def _json_bytes(obj):
+    """Serialize obj to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+# Shared parser: building the lex/yacc tables is expensive, so do it once
+# per process (and reuse the generated table modules across runs)
+_PARSER = c_parser.CParser(lex_optimize=True, lextab='pycparser.lextab',
+                           yacc_optimize=True, yacctab='pycparser.yacctab')
+
+
+# Fixed parts of the CRUD table in generate_report
+_CRUD_OPS = ('create', 'read', 'write', 'delete')
+_SUMMARY_HEADER = ("\n## File Access Summary (CRUD)",
+                   "| File | CREATE | READ | UPDATE | DELETE |",
+                   "|------|--------|------|--------|--------|")
+
+
+class MoveCodeAnalyzer(c_ast.NodeVisitor):
+    """Analyzes C code for MOVE middleware operations"""
+    
+    def __init__(self, filename, track_all_calls=True):
+        self.filename = filename
+        self.track_all_calls = track_all_calls  # False: record MOVE operations only
+        self.functions = {}  # {func_name: {calls: [], move_ops: []}}
+        self._seen_calls = {}  # {func_name: {(called, line)}} for O(1) dedup
+        self.current_function = None
+    
+    def visit_FuncDef(self, node):
+        """Visit function definition"""
+        self.current_function = self._enter_function(node, None)
+        self.generic_visit(node)
+        self.current_function = None
+    
+    def generic_visit(self, node):
+        """Visit children using the precomputed _CHILD_FIELDS table"""
+        visit = self.visit
+        for field, is_list in _CHILD_FIELDS[type(node)]:
+            child = getattr(node, field)
+            if child is None:
+                continue
+            if is_list:
+                for c in child:
+                    visit(c)
+            else:
+                visit(child)
+    
+    def visit_FuncCall(self, node):
+        """Visit function call"""
+        self._record_call(node, self.current_function)
+        self.generic_visit(node)
+    
+    def visit_iter(self, root):
+        """Iterative equivalent of visit() using an explicit stack"""
+        # Each entry carries its enclosing function, so deep ASTs need no
+        # Python frames per node and cannot hit the recursion limit
+        handlers = {c_ast.FuncDef: self._enter_function,
+                    c_ast.FuncCall: self._record_call}
+        stack = deque([(root, None)])
+        pop, push = stack.pop, stack.append
+        
+        while stack:
+            node, cur = pop()
+            node_type = type(node)
+            handler = handlers.get(node_type)
+            if handler is not None:
+                cur = handler(node, cur)
+            
+            # Push children in reverse so they are popped in source order
+            for field, is_list in reversed(_CHILD_FIELDS[node_type]):
+                child = getattr(node, field)
+                if child is None:
+                    continue
+                if is_list:
+                    for c in reversed(child):
+                        push((c, cur))
+                else:
+                    push((child, cur))
+    
+    def _enter_function(self, node, cur):
+        """Start recording a function definition; returns its name"""
+        func_name = sys.intern(node.decl.name)
+        self._add_function(func_name, node.coord.line if node.coord else None)
+        return func_name
+    
+    def _add_function(self, func_name, line):
+        """Register a function definition"""
+        self.functions[func_name] = {
+            'line': line,
+            'calls': [],
+            'move_operations': []
+        }
+        self._seen_calls[func_name] = set()
+    
+    def _record_call(self, node, cur):
+        """Record a call made from function cur; returns cur unchanged"""
+        if not cur or not isinstance(node.name, c_ast.ID):
+            return cur
+        
+        func_name = sys.intern(node.name.name)
+        line = node.coord.line if node.coord else None
+        
+        move_op = None
+        op_type = FUNC_TO_OPTYPE.get(func_name)
+        if op_type is not None:
+            move_op = self._extract_move_operation(node, func_name, op_type, line)
+        
+        self._add_call(cur, func_name, line, move_op)
+        return cur
+    
+    def _add_call(self, caller, func_name, line, move_op=None):
+        """Record a call (and its MOVE operation, if any) made from caller"""
+        if self.track_all_calls:
+            seen = self._seen_calls[caller]
+            if (func_name, line) not in seen:
+                seen.add((func_name, line))
+                self.functions[caller]['calls'].append({'function': func_name, 'line': line})
+        
+        if move_op is not None:
+            self.functions[caller]['move_operations'].append(move_op)
+    
+    def _extract_move_operation(self, node, func_name, op_type, line):
+        """Extract details from MOVE function call"""
+        # Extract filenum (first argument)
+        filenum = 'unknown'
+        if node.args and node.args.exprs:
+            first_arg = node.args.exprs[0]
+            if isinstance(first_arg, c_ast.Constant):
+                filenum = sys.intern(first_arg.value)
+            elif isinstance(first_arg, c_ast.ID):
+                filenum = f"var:{first_arg.name}"
+        
+        return {
+            'function': func_name,
+            'operation': op_type,
+            'filenum': filenum,
+            'line': line
+        }
+    
+    def get_call_graph(self, unique=False):
+        """Return call graph as dictionary (each callee once per caller if unique)
+
+        Without track_all_calls only the edges to MOVE functions are known.
+        """
+        key = 'calls' if self.track_all_calls else 'move_operations'
+        if unique:
+            return {func: list(dict.fromkeys(c['function'] for c in data[key]))
+                    for func, data in self.functions.items()}
+        return {func: [c['function'] for c in data[key]] 
+                for func, data in self.functions.items()}
+    
+    def get_calls_with_lines(self):
+        """Return all function calls as [{'function': ..., 'line': ...}]"""
+        return [call for data in self.functions.values() for call in data['calls']]
+    
+    def get_move_operations(self):
+        """Return all MOVE operations"""
+        ops = []
+        for func, data in self.functions.items():
+            for op in data['move_operations']:
+                ops.append({
+                    'caller': func,
+                    **op
+                })
+        return ops
+    
+    def get_file_access_summary(self):
+        """Summarize which functions access which files"""
+        # {filenum: {'read': set(), 'write': set(), ...}}
+        summary = defaultdict(lambda: {'create': set(), 'read': set(), 'write': set(), 'delete': set()})
+        
+        for func, data in self.functions.items():
+            for op in data['move_operations']:
+                summary[op['filenum']][op['operation'].lower()].add(func)
+        
+        return summary
+    
+    def generate_report(self):
+        """Generate analysis report as string"""
+        lines = ["# Analysis Report: %s" % self.filename,
+                 "\n## Functions Found: %d" % len(self.functions)]
+        add, extend = lines.append, lines.extend
+        
+        for func, data in self.functions.items():
+            add("\n### %s() [Line %s]" % (func, data['line']))
+            
+            if data['calls']:
+                add("**Calls:**")
+                extend(["  - %s()" % call['function'] for call in data['calls']])
+            
+            if data['move_operations']:
+                add("**MOVE Operations:**")
+                extend(["  - %s: %s(filenum=%s)" % (op['operation'], op['function'], op['filenum'])
+                        for op in data['move_operations']])
+        
+        # File access summary
+        summary = self.get_file_access_summary()
+        if summary:
+            extend(_SUMMARY_HEADER)
+            for filenum, ops in summary.items():
+                cells = [', '.join(sorted(ops[op_type])) or '-' for op_type in _CRUD_OPS]
+                add("| %s | %s | %s | %s | %s |" % (filenum, *cells))
+        
+        return '\n'.join(lines)
+    
+    def generate_graphviz(self, unique=False):
+        """Generate Graphviz DOT for call graph (each edge once if unique)"""
+        call_graph = self.get_call_graph(unique)
+        buf = io.StringIO()
+        buf.write('digraph CallGraph {\n    rankdir=TB;\n    node [shape=rectangle];\n')
+        
+        # Add MOVE function nodes with different style (only those in the graph)
+        referenced = {called for calls in call_graph.values() for called in calls}
+        referenced.update(call_graph)
+        buf.write('    // MOVE functions\n')
+        for func in ALL_MOVE_FUNCS:
+            if func in referenced:
+                buf.write(f'    "{func}" [shape=cylinder, style=filled, fillcolor=lightblue];\n')
+        
+        # Add edges
+        buf.write('    // Call edges\n')
+        for func, calls in call_graph.items():
+            for called in calls:
+                buf.write(f'    "{func}" -> "{called}";\n')
+        
+        buf.write('}')
+        return buf.getvalue()
+
+
+def _preprocess_cache_dir():
+    """Directory for cached .i files, or None if MOVE_ANALYZER_NO_CACHE is set"""
+    if os.environ.get('MOVE_ANALYZER_NO_CACHE'):
+        return None
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'move_analyzer')
+
+
+def _prune_cache(cache_dir):
+    """Delete cache entries unused for CACHE_MAX_AGE (once per process)"""
+    if cache_dir in _pruned_cache_dirs:
+        return
+    _pruned_cache_dirs.add(cache_dir)
+    
+    cutoff = time.time() - CACHE_MAX_AGE
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _cpp_dependencies(path, text, cpp_args):
+    """{file: mtime_ns} for everything the preprocessed text was built from"""
+    # Files named by linemarkers (source and every header actually read),
+    # plus their directories and the -I directories, since quoted includes
+    # search the including file's directory first and a newly added header
+    # there or on the include path would shadow the one that was used
+    deps = {os.path.abspath(dep) for dep in _LINEMARKER.findall(text)
+            if not dep.startswith('<')}
+    deps.add(os.path.abspath(path))
+    deps.update({os.path.dirname(dep) for dep in deps})
+    deps.update(os.path.abspath(arg[2:]) for arg in cpp_args if arg.startswith('-I'))
+    return {dep: os.stat(dep).st_mtime_ns for dep in deps if os.path.exists(dep)}
+
+
+def _dependencies_unchanged(deps):
+    """True if every recorded dependency still has its recorded mtime"""
+    try:
+        return all(os.stat(dep).st_mtime_ns == mtime for dep, mtime in deps.items())
+    except OSError:
+        return False
+
+
+def preprocess_cached(path, cpp_args):
+    """Run cpp on path, reusing a cached .i file while none of its inputs changed
+
+    Entries live under $XDG_CACHE_HOME/move_analyzer (default ~/.cache); set
+    MOVE_ANALYZER_NO_CACHE to always run cpp.
+    """
+    cache_dir = _preprocess_cache_dir()
+    cache_path = None
+    if cache_dir:
+        # One entry per (source, cwd, cpp arguments); edits overwrite it
+        key = [os.path.abspath(path), os.getcwd(), *cpp_args]
+        digest = hashlib.sha1('\0'.join(key).encode()).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{digest}.i")
+        
+        # First line of an entry is the JSON {dependency: mtime_ns} map
+        try:
+            with open(cache_path) as f:
+                deps = json.loads(f.readline())
+                if _dependencies_unchanged(deps):
+                    text = f.read()
+                    os.utime(cache_path)  # mark as recently used for pruning
+                    return text
+        except (OSError, ValueError):
+            pass
+    
+    # One cpp per file: a long-lived cpp fed '#include' stubs is not workable,
+    # since cpp reads stdin to EOF before emitting anything and one shared
+    # translation unit would leak include guards/macros between files.
+    # Instead keep each spawn cheap: with an absolute path and close_fds=False
+    # subprocess uses posix_spawn rather than forking this process.
+    # cpp's stderr is left attached so its errors are printed, as with parse_file
+    started = time.time_ns()
+    result = subprocess.run([CPP_PATH, *cpp_args, path], stdout=subprocess.PIPE,
+                            universal_newlines=True, check=True, close_fds=False)
+    
+    text = result.stdout
+    
+    if cache_path:
+        try:
+            deps = _cpp_dependencies(path, text, cpp_args)
+            # Skip caching if an input was modified while cpp was running
+            if all(mtime < started for mtime in deps.values()):
+                os.makedirs(cache_dir, exist_ok=True)
+                _prune_cache(cache_dir)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(json.dumps(deps) + '\n')
+                    f.write(text)
+                os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # caching is best effort
+    
+    return text
+
+
+def _token_filenum(tokens, i):
+    """filenum for a MOVE call whose first argument token is tokens[i]"""
+    if i + 1 < len(tokens) and tokens[i + 1].type in ('COMMA', 'RPAREN'):
+        tok = tokens[i]
+        if tok.type == 'ID':
+            return f"var:{tok.value}"
+        if '_CONST' in tok.type or tok.type.endswith('STRING_LITERAL'):
+            return sys.intern(tok.value)
+    return 'unknown'
+
+
+# Token kinds and events for the --fast scan kernel
+(_TOK_OTHER, _TOK_ID, _TOK_LPAREN, _TOK_RPAREN, _TOK_LBRACE, _TOK_RBRACE, _TOK_SEMI,
+ _TOK_MEMBER) = range(8)
+_TOKEN_KIND = {'ID': _TOK_ID, 'LPAREN': _TOK_LPAREN, 'RPAREN': _TOK_RPAREN,
+               'LBRACE': _TOK_LBRACE, 'RBRACE': _TOK_RBRACE, 'SEMI': _TOK_SEMI,
+               'ARROW': _TOK_MEMBER, 'PERIOD': _TOK_MEMBER}
+_EVENT_DEF, _EVENT_CALL = 1, 2
+
+# GNU extension keywords that CLexer returns as plain IDs; followed by '(' they
+# are not calls, so the scan treats them as _TOK_OTHER
+_GNU_KEYWORDS = frozenset([
+    '__attribute__', '__attribute', '__asm__', '__asm', 'asm',
+    '__typeof__', '__typeof', 'typeof', '__alignof__', '__alignof',
+    '__extension__', '__declspec', '__volatile__', '__volatile',
+])
+
+
+def _scan_token_kinds(kinds, out_event, out_tok):
+    """Find function definitions and calls in a stream of token kinds
+
+    Writes (event, index of the name token) pairs into out_event/out_tok and
+    returns how many were written. Function definitions are file-scope
+    `name ( ... ) {`; calls are `ID (` pairs inside their bodies, except
+    member calls like `o->fn(` which have no static callee.
+    """
+    n_events = 0
+    depth = 0          # brace depth
+    parens = 0         # paren depth at file scope
+    candidate = -1     # name token of the last file-scope "name ("
+    in_function = False
+    prev = -1
+    prev2 = -1
+    
+    for i in range(len(kinds)):
+        kind = kinds[i]
+        if kind == _TOK_LBRACE:
+            if depth == 0 and prev == _TOK_RPAREN and candidate >= 0:
+                out_event[n_events] = _EVENT_DEF
+                out_tok[n_events] = candidate
+                n_events += 1
+                in_function = True
+            depth += 1
+        elif kind == _TOK_RBRACE:
+            depth -= 1
+            if depth == 0:
+                in_function = False
+                candidate = -1
+        elif depth == 0:
+            if kind == _TOK_LPAREN:
+                if parens == 0 and prev == _TOK_ID:
+                    candidate = i - 1
+                parens += 1
+            elif kind == _TOK_RPAREN:
+                parens -= 1
+            elif kind == _TOK_SEMI:
+                candidate = -1
+        elif in_function and kind == _TOK_LPAREN and prev == _TOK_ID and prev2 != _TOK_MEMBER:
+            out_event[n_events] = _EVENT_CALL
+            out_tok[n_events] = i - 1
+            n_events += 1
+        prev2 = prev
+        prev = kind
+    
+    return n_events
+
+
+def fast_analyze_file(filepath, track_all_calls=True, text=None):
+    """Analyze a preprocessed C file from its token stream alone (no yacc parse)
+
+    See _scan_token_kinds for what is recognized. This covers ordinary C but
+    can misreport unusual code (e.g. local prototypes); use the full parser
+    when exact results matter. text is the preprocessed source, if already known.
+    """
+    if text is None:
+        text = preprocess_cached(filepath, CPP_ARGS)
+    
+    lexer = c_lexer.CLexer(error_func=lambda *args: None,
+                           on_lbrace_func=lambda: None,
+                           on_rbrace_func=lambda: None,
+                           type_lookup_func=lambda name: False)
+    if hasattr(lexer, 'build'):  # PLY-based lexer (pycparser < 3)
+        lexer.build(optimize=True, lextab='pycparser.lextab')
+    lexer.input(text)
+    tokens = list(iter(lexer.token, None))
+    
+    # The per-token loop runs over small ints; only the resulting events
+    # are turned back into dicts
+    kind_of = _TOKEN_KIND.get
+    kinds = [_TOK_OTHER if t.value in _GNU_KEYWORDS else kind_of(t.type, _TOK_OTHER)
+             for t in tokens]
+    out_event = [0] * len(tokens)
+    out_tok = [0] * len(tokens)
+    n_events = _scan_token_kinds(kinds, out_event, out_tok)
+    
+    analyzer = MoveCodeAnalyzer(filepath, track_all_calls)
+    current = None
+    for event, i in zip(out_event[:n_events], out_tok[:n_events]):
+        name_tok = tokens[i]
+        if event == _EVENT_DEF:
+            current = sys.intern(name_tok.value)
+            analyzer._add_function(current, name_tok.lineno)
+            continue
+        
+        func_name = sys.intern(name_tok.value)
+        line = name_tok.lineno
+        
+        move_op = None
+        op_type = FUNC_TO_OPTYPE.get(func_name)
+        if op_type is not None:
+            move_op = {
+                'function': func_name,
+                'operation': op_type,
+                'filenum': _token_filenum(tokens, i + 2),
+                'line': line
+            }
+        analyzer._add_call(current, func_name, line, move_op)
+    
+    return analyzer
+
+
+def _cache_key(text, fast=False, track_all_calls=True):
+    """Parse-cache key: preprocessed source, analysis mode, cache/pycparser versions, MOVE funcs"""
+    data = text.encode()
+    data += b'fast' if fast else b'accurate'
+    data += b'all-calls' if track_all_calls else b'move-only'
+    data += f"v{CACHE_VERSION}".encode()
+    data += pycparser.__version__.encode()
+    data += repr(tuple(ALL_MOVE_FUNCS)).encode()
+    return hashlib.sha1(data).hexdigest()
+
+
+def _load_cached(cache_path, filepath, track_all_calls):
+    """Analyzer rebuilt from a parse-cache entry, or None if missing or unreadable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            functions = pickle.load(f)['functions']
+        os.utime(cache_path)  # mark as recently used for pruning
+    except Exception:
+        return None  # a corrupt entry just means a full parse
+    
+    analyzer = MoveCodeAnalyzer(filepath, track_all_calls)
+    analyzer.functions = functions
+    return analyzer
+
+
+def analyze_file(filepath, cache_dir=None, fast=False, track_all_calls=True):
+    """Analyze a single C file, reusing cached results when cache_dir is given
+
+    fast selects the token-level scan (fast_analyze_file) instead of a full parse;
+    track_all_calls=False records only MOVE operations (see MoveCodeAnalyzer).
+    """
+    print(f"Analyzing: {filepath}")
+    
+    try:
+        text = preprocess_cached(filepath, CPP_ARGS)
+        
+        # Keyed on the preprocessed text, so header edits invalidate entries too
+        cache_path = None
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"{_cache_key(text, fast, track_all_calls)}.pkl")
+            analyzer = _load_cached(cache_path, filepath, track_all_calls)
+            if analyzer:
+                return analyzer
+        
+        if fast:
+            analyzer = fast_analyze_file(filepath, track_all_calls, text)
+        else:
+            ast = _PARSER.parse(text, filename=filepath)
+            analyzer = MoveCodeAnalyzer(filepath, track_all_calls)
+            analyzer.visit_iter(ast)
+    except Exception as e:
+        print(f"Error parsing {filepath}: {e}")
+        return None
+    
+    if cache_path:
+        # Write to a temp file first so concurrent workers never see a partial pickle
+        try:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(pickle.dumps({'functions': analyzer.functions}, protocol=5))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # caching is best effort
+    
+    return analyzer
+
+
+def _analyze_and_serialize(filepath, cache_dir=None, fast=False, track_all_calls=True):
+    """Analyze a C file in a worker process and return picklable results"""
+    analyzer = analyze_file(filepath, cache_dir, fast, track_all_calls)
+    if not analyzer:
+        return None
+    
+    return (os.path.basename(filepath),
+            analyzer.get_move_operations(),
+            analyzer.get_call_graph(),
+            analyzer.generate_report(),
+            analyzer.generate_graphviz())
+
+
+def iter_c_files(dirpath):
+    """Yield paths of all .c files under dirpath (recursive)"""
+    # DirEntry carries the file type from the directory listing itself,
+    # so no extra stat() per entry is needed
+    try:
+        entries = os.scandir(dirpath)
+    except OSError:
+        return  # unreadable directory: skip it, as os.walk does
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_c_files(entry.path)
+            elif entry.name.endswith('.c') and entry.is_file():
+                yield entry.path
+
+
+def analyze_directory(dirpath, output_dir='analysis_output', fast=False, track_all_calls=True):
+    """Analyze all C files in directory
+
+    With track_all_calls=False, reports and call graphs only show MOVE calls,
+    but each worker keeps (and caches) far less data per file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_dir = None
+    if not os.environ.get('MOVE_ANALYZER_NO_CACHE'):
+        cache_dir = os.path.join(output_dir, CACHE_DIRNAME)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Entries are keyed on content, so each edit adds one; drop unused ones
+        _prune_cache(cache_dir)
+    
+    # Combined data is streamed out per file rather than held in memory:
+    # one MOVE operation per line, and the call graph object written key by key
+    ops_file = open(os.path.join(output_dir, 'all_move_operations.jsonl'), 'wb')
+    graphs_file = open(os.path.join(output_dir, 'all_call_graphs.json'), 'wb')
+    
+    # Files are parsed independently, so spread them across processes
+    # (pycparser is pure Python and would be GIL-bound with threads)
+    with ops_file, graphs_file, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        graphs_file.write(b'{')
+        try:
+            separator = b''
+            
+            worker = partial(_analyze_and_serialize, cache_dir=cache_dir,
+                             fast=fast, track_all_calls=track_all_calls)
+            for result in executor.map(worker, iter_c_files(dirpath)):
+                if not result:
+                    continue
+                
+                file, move_ops, call_graph, report, dot = result
+                
+                # Save individual report
+                report_path = os.path.join(output_dir, f"{file}_analysis.md")
+                with open(report_path, 'w') as f:
+                    f.write(report)
+                
+                # Save call graph
+                dot_path = os.path.join(output_dir, f"{file}_callgraph.dot")
+                with open(dot_path, 'w') as f:
+                    f.write(dot)
+                
+                # Append combined data
+                for op in move_ops:
+                    ops_file.write(_json_bytes(op) + b'\n')
+                graphs_file.write(separator + _json_bytes(file) + b':' + _json_bytes(call_graph))
+                separator = b','
+        finally:
+            # Close the object even if a worker fails or the run is interrupted
+            graphs_file.write(b'}')
+    
+    print(f"\nAnalysis complete. Results in: {output_dir}/")
+
+
+# Main execution
+if __name__ == '__main__':
+    # --fast: token-level scan only; --accurate (default): full pycparser parse
+    # --move-only: record MOVE operations only, not every function call
+    # --no-cache: always run cpp and reparse (same as MOVE_ANALYZER_NO_CACHE=1)
+    flags = [arg for arg in sys.argv[1:]
+             if arg in ('--fast', '--accurate', '--move-only', '--no-cache')]
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    modes = [flag for flag in flags if flag in ('--fast', '--accurate')]
+    fast = bool(modes) and modes[-1] == '--fast'
+    track_all_calls = '--move-only' not in flags
+    if '--no-cache' in flags:
+        os.environ['MOVE_ANALYZER_NO_CACHE'] = '1'  # inherited by worker processes
+    
+    if len(args) < 1:
+        print("Usage: python move_analyzer.py [--fast | --accurate] [--move-only] [--no-cache] <file.c or directory>")
+        sys.exit(1)
+    
+    target = args[0]
+    
+    if os.path.isfile(target):
+        analyzer = analyze_file(target, fast=fast, track_all_calls=track_all_calls)
+        if analyzer:
+            print("\n" + analyzer.generate_report())
+    elif os.path.isdir(target):
+        analyze_directory(target, fast=fast, track_all_calls=track_all_calls)
+    else:
+        print(f"Error: {target} not found")